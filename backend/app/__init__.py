@@ -15,8 +15,9 @@ jwt = JWTManager()
 def create_app():
     app = Flask(__name__)
 
-    # Trust reverse proxy headers (X-Forwarded-Proto/Host) for correct URL scheme in prod
-    app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+    # Trust reverse proxy headers (X-Forwarded-Proto/Host) for correct URL scheme in prod,
+    # and X-Forwarded-For so per-IP rate limits see the client rather than the proxy
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
 
     # --- Core config ----------------------------------------------------------
     flask_env = os.getenv("FLASK_ENV", "development")
@@ -35,6 +36,18 @@ def create_app():
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///missionlink.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Missionary contact-card detail (/api/missionaries/<id>)
+    app.config['MISSIONARY_DETAIL_REPORTS'] = int(os.getenv('MISSIONARY_DETAIL_REPORTS', '5'))
+    app.config['MISSIONARY_DETAIL_TTL'] = int(os.getenv('MISSIONARY_DETAIL_TTL', '60'))
+
+    # Global "latest reports" feed (/api/feed): max rows kept in the FeedItem table
+    app.config['FEED_MAX_ITEMS'] = int(os.getenv('FEED_MAX_ITEMS', '500'))
+
+    # Admission control for login/register and uploads (see app/admission.py).
+    # ADMISSION_DB must be on local disk shared by all gunicorn workers.
+    app.config['ADMISSION_ENABLED'] = os.getenv('ADMISSION_ENABLED', '1') != '0'
+    app.config['ADMISSION_DB'] = os.getenv('ADMISSION_DB')
+
     # --- CORS for frontend (dev + prod) --------------------------------------
     # Base allowlist
     cors_origins = {
@@ -66,8 +79,11 @@ def create_app():
     db.init_app(app)
     jwt.init_app(app)
 
+    from . import admission
+    admission.init_app(app)
+
     # Import models so db.create_all() sees them
-    from .models import User, Missionary, Country, Assignment, Report  # noqa
+    from .models import User, Missionary, Country, Assignment, Report, ReportImage, FeedItem  # noqa
 
     with app.app_context():
         db.create_all()
@@ -139,4 +155,13 @@ def create_app():
     from .routes import api_bp
     app.register_blueprint(api_bp, url_prefix='/api')
 
+    # --- CLI --------------------------------------------------------------------
+    # flask --app run rebuild-feed
+    @app.cli.command("rebuild-feed")
+    def rebuild_feed():
+        """Regenerate the global feed table from existing reports."""
+        from . import feed
+        n = feed.rebuild()
+        print(f"Feed rebuilt: {n} items")
+
     return app
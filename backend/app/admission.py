@@ -0,0 +1,169 @@
+# app/admission.py
+"""
+Admission control for expensive endpoints (password hashing, uploads).
+
+Each endpoint class gets a concurrency cap plus token-bucket rate limits keyed
+per client IP and per JWT identity. State lives in a small SQLite file so every
+gunicorn worker on the host shares the same counters. Requests that can't be
+admitted are rejected immediately (429 rate limited / 503 saturated) with
+Retry-After, leaving threads free for cheap reads like /healthz and /countries.
+"""
+from contextlib import contextmanager
+from functools import wraps
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from flask import current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity
+
+# concurrency: max in-flight requests across all workers
+# rate/burst: token bucket per IP and per identity (tokens per second, bucket size)
+DEFAULT_CLASSES = {
+    'auth':   {'concurrency': 2, 'rate': 0.2, 'burst': 10},
+    'upload': {'concurrency': 2, 'rate': 0.1, 'burst': 5},
+}
+
+SLOT_TTL = 90          # seconds; longer than gunicorn's --timeout so killed workers' slots expire
+BUSY_TIMEOUT = 0.5     # seconds to wait on the SQLite write lock
+BUCKET_IDLE = 3600     # seconds before an untouched bucket row is purged
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS slots (token TEXT PRIMARY KEY, cls TEXT NOT NULL, expires REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS ix_slots_cls ON slots (cls);
+CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL);
+"""
+
+class SharedStore:
+    """Slots + token buckets in a SQLite file shared by all local worker processes."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _conn(self):
+        # one connection per thread, re-opened after fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    @contextmanager
+    def _tx(self):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def acquire(self, cls, limit):
+        """Take a concurrency slot for `cls`; returns a release token or None if saturated."""
+        now = time.time()
+        with self._tx() as conn:
+            conn.execute("DELETE FROM slots WHERE cls = ? AND expires < ?", (cls, now))
+            (in_flight,) = conn.execute("SELECT COUNT(*) FROM slots WHERE cls = ?", (cls,)).fetchone()
+            if in_flight >= limit:
+                return None
+            token = uuid.uuid4().hex
+            conn.execute("INSERT INTO slots (token, cls, expires) VALUES (?, ?, ?)", (token, cls, now + SLOT_TTL))
+            return token
+
+    def release(self, token):
+        with self._tx() as conn:
+            conn.execute("DELETE FROM slots WHERE token = ?", (token,))
+
+    def take(self, keys, rate, burst):
+        """
+        Consume one token from every bucket in `keys`, all or nothing.
+        Returns 0 when admitted, otherwise the seconds until a token is available.
+        """
+        now = time.time()
+        with self._tx() as conn:
+            levels = {}
+            wait = 0.0
+            for key in keys:
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+                if tokens < 1:
+                    wait = max(wait, (1 - tokens) / rate)
+                levels[key] = tokens
+            for key, tokens in levels.items():
+                conn.execute("INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                             (key, tokens - 1 if not wait else tokens, now))
+            if random.random() < 0.01:
+                conn.execute("DELETE FROM buckets WHERE updated < ?", (now - BUCKET_IDLE,))
+        return wait
+
+def init_app(app):
+    if not app.config.get('ADMISSION_ENABLED', True):
+        return
+    classes = {cls: dict(cfg) for cls, cfg in DEFAULT_CLASSES.items()}
+    for cls, cfg in (app.config.get('ADMISSION_CLASSES') or {}).items():
+        classes.setdefault(cls, {}).update(cfg)
+    path = app.config.get('ADMISSION_DB') or os.path.join(tempfile.gettempdir(), 'missionlink-admission.sqlite3')
+    app.extensions['admission'] = {'store': SharedStore(path), 'classes': classes}
+
+def _identity():
+    try:
+        return get_jwt_identity()
+    except Exception:
+        return None  # no verified JWT in this request (e.g. login)
+
+def _reject(status, error, retry_after):
+    resp = jsonify({'error': error, 'retry_after': retry_after})
+    resp.status_code = status
+    resp.headers['Retry-After'] = str(retry_after)
+    return resp
+
+def limit(cls):
+    """
+    Gate a view behind the `cls` admission class. Place below @jwt_required()
+    so the per-identity bucket can see the caller.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            ext = current_app.extensions.get('admission')
+            if not ext:
+                return fn(*args, **kwargs)
+            store, cfg = ext['store'], ext['classes'][cls]
+
+            keys = [f'{cls}:ip:{request.remote_addr or "-"}']
+            ident = _identity()
+            if ident is not None:
+                keys.append(f'{cls}:id:{ident}')
+
+            token = None
+            try:
+                wait = store.take(keys, cfg['rate'], cfg['burst'])
+                if wait:
+                    return _reject(429, 'rate_limited', math.ceil(wait))
+                token = store.acquire(cls, cfg['concurrency'])
+                if token is None:
+                    return _reject(503, 'overloaded', 1)
+            except sqlite3.Error:
+                # the limiter must never take the API down with it: fail open
+                current_app.logger.warning('admission store unavailable; admitting %s request', cls)
+
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if token:
+                    try:
+                        store.release(token)
+                    except sqlite3.Error:
+                        pass  # slot expires after SLOT_TTL
+        return wrapper
+    return decorator
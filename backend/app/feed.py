@@ -0,0 +1,92 @@
+# app/feed.py
+"""
+Global "latest reports" feed, materialized into FeedItem on write.
+
+Report writes fan out here so reading the feed is a single range scan over
+FeedItem's primary key, with no joins against Report/Missionary/Country/ReportImage.
+"""
+from flask import current_app
+
+from . import db
+from .models import Missionary, Country, Report, ReportImage, FeedItem
+
+EXCERPT_LEN = 280
+
+def _excerpt(content):
+    text = ' '.join((content or '').split())
+    return text if len(text) <= EXCERPT_LEN else text[:EXCERPT_LEN - 1].rstrip() + '…'
+
+def _max_items():
+    return current_app.config.get('FEED_MAX_ITEMS', 500)
+
+def _build_item(r, m, c, images):
+    return FeedItem(
+        report_id=r.id, missionary_id=m.id,
+        missionary_name=m.display_name, avatar_url=m.avatar_url,
+        country_iso2=c.iso2, country_name=c.name,
+        title=r.title, excerpt=_excerpt(r.content),
+        thumb_url=images[0].url if images else None, image_count=len(images),
+        file_url=r.file_url, file_name=r.file_name,
+        created_at=r.created_at,
+    )
+
+def trim():
+    """Drop everything older than the newest FEED_MAX_ITEMS rows."""
+    cutoff = (db.session.query(FeedItem.id).order_by(FeedItem.id.desc())
+              .offset(_max_items()).limit(1).scalar())
+    if cutoff is not None:
+        FeedItem.query.filter(FeedItem.id <= cutoff).delete(synchronize_session=False)
+
+def publish_report(r, m, c, images):
+    """Fan a freshly created report out to the feed. Caller commits."""
+    db.session.add(_build_item(r, m, c, images))
+    db.session.flush()
+    trim()
+
+def refresh_missionary(m):
+    """Propagate profile changes (name/avatar) into the missionary's feed rows. Caller commits."""
+    FeedItem.query.filter_by(missionary_id=m.id).update(
+        {'missionary_name': m.display_name, 'avatar_url': m.avatar_url},
+        synchronize_session=False)
+
+def remove_report(report_id):
+    FeedItem.query.filter_by(report_id=report_id).delete(synchronize_session=False)
+
+def remove_missionary(missionary_id):
+    FeedItem.query.filter_by(missionary_id=missionary_id).delete(synchronize_session=False)
+
+def latest(limit, before=None):
+    q = FeedItem.query
+    if before is not None:
+        q = q.filter(FeedItem.id < before)
+    return q.order_by(FeedItem.id.desc()).limit(limit).all()
+
+def item_dict(f):
+    return {
+        'id': f.id, 'report_id': f.report_id,
+        'missionary': {'id': f.missionary_id, 'display_name': f.missionary_name, 'avatar_url': f.avatar_url},
+        'country_iso2': f.country_iso2, 'country_name': f.country_name,
+        'title': f.title, 'excerpt': f.excerpt,
+        'thumb_url': f.thumb_url, 'image_count': f.image_count,
+        'file_url': f.file_url, 'file_name': f.file_name,
+        'created_at': f.created_at.isoformat(),
+    }
+
+def rebuild():
+    """Regenerate the feed from the newest FEED_MAX_ITEMS reports. Returns the row count."""
+    FeedItem.query.delete(synchronize_session=False)
+    rows = (db.session.query(Report, Missionary, Country)
+            .join(Missionary, Missionary.id == Report.missionary_id)
+            .join(Country, Country.id == Report.country_id)
+            .order_by(Report.created_at.desc(), Report.id.desc())
+            .limit(_max_items()).all())
+    images = {}
+    if rows:
+        ids = [r.id for r, _, _ in rows]
+        for img in ReportImage.query.filter(ReportImage.report_id.in_(ids)).order_by(ReportImage.id).all():
+            images.setdefault(img.report_id, []).append(img)
+    # oldest first so primary-key order matches created_at order
+    for r, m, c in reversed(rows):
+        db.session.add(_build_item(r, m, c, images.get(r.id, [])))
+    db.session.commit()
+    return len(rows)
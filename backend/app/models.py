@@ -67,3 +67,21 @@ class ReportImage(db.Model):
     name = db.Column(db.String(255))                  # original filename
     width = db.Column(db.Integer)                     # optional
     height = db.Column(db.Integer)                    # optional
+
+class FeedItem(db.Model):
+    # Denormalized card for the global "latest reports" feed, written alongside the report.
+    # Rows are inserted oldest -> newest, so primary-key order is feed order.
+    id = db.Column(db.Integer, primary_key=True)
+    report_id = db.Column(db.Integer, db.ForeignKey('report.id'), unique=True, nullable=False)
+    missionary_id = db.Column(db.Integer, db.ForeignKey('missionary.id'), nullable=False, index=True)
+    missionary_name = db.Column(db.String(120))
+    avatar_url = db.Column(db.String(255))
+    country_iso2 = db.Column(db.String(2))
+    country_name = db.Column(db.String(120))
+    title = db.Column(db.String(200), nullable=False)
+    excerpt = db.Column(db.String(300))
+    thumb_url = db.Column(db.String(255))             # first report image, if any
+    image_count = db.Column(db.Integer, default=0)
+    file_url = db.Column(db.String(255))
+    file_name = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, nullable=False)
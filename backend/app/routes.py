@@ -2,11 +2,11 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
-import os, uuid, mimetypes
+import os, uuid, mimetypes, threading, time
 from PIL import Image, UnidentifiedImageError
 import pycountry
 
-from . import db
+from . import db, feed, admission
 from .models import User, Missionary, Country, Assignment, Report, ReportImage
 
 api_bp = Blueprint('api', __name__)
@@ -34,8 +34,34 @@ def _ensure_country(iso2):
     db.session.add(c); db.session.commit()
     return c
 
+# ---------- missionary detail cache ----------
+# Per-missionary payloads for contact cards. Writes in this worker invalidate
+# immediately; the TTL bounds staleness in the other gunicorn workers.
+_detail_cache = {}
+_detail_lock = threading.Lock()
+
+def _detail_cache_get(mid):
+    ttl = current_app.config.get('MISSIONARY_DETAIL_TTL', 60)
+    with _detail_lock:
+        hit = _detail_cache.get(mid)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+    return None
+
+def _detail_cache_put(mid, payload):
+    with _detail_lock:
+        _detail_cache[mid] = (time.monotonic(), payload)
+
+def _invalidate_missionary(mid):
+    with _detail_lock:
+        _detail_cache.pop(mid, None)
+
+def _image_dict(img):
+    return {'id': img.id, 'url': img.url, 'mime': img.mime, 'name': img.name, 'width': img.width, 'height': img.height}
+
 # ---------- auth ----------
 @api_bp.route('/auth/register', methods=['POST'])
+@admission.limit('auth')
 def register():
     data = request.get_json() or {}
     email = (data.get('email') or '').strip().lower()
@@ -53,6 +79,7 @@ def register():
     return jsonify({'message': 'registered'}), 201
 
 @api_bp.route('/auth/login', methods=['POST'])
+@admission.limit('auth')
 def login():
     data = request.get_json() or {}
     email = (data.get('email') or '').strip().lower()
@@ -115,6 +142,68 @@ def reports_by_country(iso2):
                    for img in r.images]
     } for r in reps])
 
+# ---------- missionaries ----------
+@api_bp.route('/missionaries/<int:mid>', methods=['GET'])
+def missionary_detail(mid):
+    """
+    Contact-card detail: profile, email, assigned ISO2 codes and the most recent
+    reports with their images. Built from at most four queries and cached per missionary.
+    """
+    cached = _detail_cache_get(mid)
+    if cached is not None:
+        return jsonify(cached)
+
+    row = (db.session.query(Missionary, User.email)
+           .join(User, User.id == Missionary.user_id)
+           .filter(Missionary.id == mid).first())
+    if not row:
+        return jsonify({'error': 'missionary not found'}), 404
+    m, email = row
+
+    assigned_iso2 = [iso for (iso,) in db.session.query(Country.iso2)
+                     .join(Assignment, Assignment.country_id == Country.id)
+                     .filter(Assignment.missionary_id == mid)
+                     .order_by(Country.iso2).all()]
+
+    limit = current_app.config.get('MISSIONARY_DETAIL_REPORTS', 5)
+    rows = (db.session.query(Report, Country.iso2, Country.name)
+            .join(Country, Country.id == Report.country_id)
+            .filter(Report.missionary_id == mid)
+            .order_by(Report.created_at.desc(), Report.id.desc())
+            .limit(limit).all())
+
+    images = {}
+    if rows:
+        ids = [r.id for r, _, _ in rows]
+        for img in ReportImage.query.filter(ReportImage.report_id.in_(ids)).order_by(ReportImage.id).all():
+            images.setdefault(img.report_id, []).append(_image_dict(img))
+
+    payload = {
+        'id': m.id, 'display_name': m.display_name, 'organization': m.organization,
+        'bio': m.bio, 'website': m.website, 'avatar_url': m.avatar_url,
+        'email': email,
+        'assigned_iso2': assigned_iso2,
+        'reports': [{
+            'id': r.id, 'title': r.title, 'content': r.content,
+            'created_at': r.created_at.isoformat(),
+            'country_iso2': iso2, 'country_name': name,
+            'file_url': r.file_url, 'file_name': r.file_name, 'file_mime': r.file_mime,
+            'images': images.get(r.id, []),
+        } for r, iso2, name in rows],
+    }
+    _detail_cache_put(mid, payload)
+    return jsonify(payload)
+
+# ---------- feed ----------
+@api_bp.route('/feed', methods=['GET'])
+def latest_feed():
+    """
+    Global latest-reports feed, newest first. Paginate with ?before=<id of last item>.
+    """
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    before = request.args.get('before', type=int)
+    return jsonify([feed.item_dict(f) for f in feed.latest(limit, before)])
+
 # ---------- me ----------
 @api_bp.route('/me', methods=['GET'])
 @jwt_required()
@@ -148,11 +237,14 @@ def update_profile():
     m.organization = data.get('organization', m.organization)
     m.bio = data.get('bio', m.bio)
     m.website = data.get('website', m.website)
+    feed.refresh_missionary(m)
     db.session.commit()
+    _invalidate_missionary(m.id)
     return jsonify({'message':'updated'})
 
 @api_bp.route('/me/avatar', methods=['POST'])
 @jwt_required()
+@admission.limit('upload')
 def upload_avatar():
     user_id = get_jwt_identity()
     u = User.query.get(int(user_id))
@@ -172,7 +264,9 @@ def upload_avatar():
     url = f'/api/files/{filename}'
 
     u.missionary.avatar_url = url
+    feed.refresh_missionary(u.missionary)
     db.session.commit()
+    _invalidate_missionary(u.missionary.id)
     return jsonify({'message':'uploaded','avatar_url':url})
 
 @api_bp.route('/me', methods=['DELETE'])
@@ -191,6 +285,9 @@ def delete_me():
     if getattr(u, 'missionary', None):
         m = u.missionary
 
+        # Feed rows first (they reference the reports)
+        feed.remove_missionary(m.id)
+
         # Delete reports + files
         reps = Report.query.filter_by(missionary_id=m.id).all()
         for r in reps:
@@ -229,8 +326,11 @@ def delete_me():
         db.session.delete(m)
 
     # Finally delete the user
+    mid = u.missionary.id if getattr(u, 'missionary', None) else None
     db.session.delete(u)
     db.session.commit()
+    if mid is not None:
+        _invalidate_missionary(mid)
     return jsonify({'message': 'account_deleted'})
 
 # ----- multiple assignments -----
@@ -286,6 +386,7 @@ def set_assignments():
             db.session.delete(a)
 
     db.session.commit()
+    _invalidate_missionary(u.missionary.id)
     return jsonify({'message': 'assignments_updated', 'countries': wanted_iso})
 
 # ---------- file helpers (mounted disk + /api/files URLs) ----------
@@ -376,6 +477,7 @@ def _save_images(files, user_id, report_id):
 # ---------- reports ----------
 @api_bp.route('/me/reports', methods=['POST'])
 @jwt_required()
+@admission.limit('upload')
 def create_report():
     user_id = get_jwt_identity()
     u = User.query.get(int(user_id))
@@ -418,9 +520,11 @@ def create_report():
                file_url=file_url, file_mime=file_mime, file_name=file_name)
     db.session.add(r); db.session.commit()
 
-    if image_files:
-        _ = _save_images(image_files, u.id, r.id)
-        db.session.commit()
+    images = _save_images(image_files, u.id, r.id) if image_files else []
+    feed.publish_report(r, u.missionary, c, images)
+    db.session.commit()
+
+    _invalidate_missionary(u.missionary.id)
 
     return jsonify({'message':'report created','id': r.id}), 201
 
@@ -469,5 +573,7 @@ def delete_my_report(rid):
         except Exception:
             pass
 
+    feed.remove_report(r.id)
     db.session.delete(r); db.session.commit()
+    _invalidate_missionary(u.missionary.id)
     return jsonify({'message':'deleted'})